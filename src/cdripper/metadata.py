@@ -5,6 +5,7 @@ Disc ID scan and MusicBrainz search
 
 import logging
 import os
+import functools
 import tempfile
 from urllib.request import urlopen
 
@@ -28,6 +29,26 @@ musicbrainz.set_useragent(
 )
 
 
+@functools.lru_cache(maxsize=256)
+def get_recording_works(rid: str) -> dict:
+    """
+    Get recording, with related works, from MusicBrainz
+
+    Recordings are commonly shared between the releases that match a disc,
+    and MusicBrainz is rate limited, so responses are cached for the life
+    of the process. Failed requests raise and so are not cached.
+
+    Arguments:
+        rid (str): MusicBrainz recording ID
+
+    Returns:
+        dict: MusicBrainz response
+
+    """
+
+    return musicbrainz.get_recording_by_id(rid, includes=['work-rels'])
+
+
 class CDMetaThread(QThread):
     """
     Thread for disc ID and search
@@ -36,11 +57,13 @@ class CDMetaThread(QThread):
     searching of MusicBrainz for the disc are placed in a separate thread.
 
     When the thread is finished running, a custom FINISHED signal is emitted to
-    signal which dev device has finshed scanning/searching for metadata
+    signal which dev device has finshed scanning/searching for metadata, along
+    with an error code; the error code is an empty string on success.
 
     """
 
-    FINISHED = pyqtSignal(str)
+    # Dev device and error code; empty string if no error
+    FINISHED = pyqtSignal(str, str)
 
     def __init__(self, dev, **kwargs):
         super().__init__()
@@ -81,12 +104,13 @@ class CDMetaThread(QThread):
                 self.dev,
                 err,
             )
-            self.FINISHED.emit(f'ERROR-{self.dev}')
+            self.FINISHED.emit(self.dev, 'ERROR')
+            return
 
         self.log.info("%s - Search finished", self.dev)
 
         # Emit custom finished signal
-        self.FINISHED.emit(self.dev)
+        self.FINISHED.emit(self.dev, '')
 
     def parseRelease(self, release):
         """
@@ -268,6 +292,7 @@ class CDMetaData(discid.Disc):
             'date': release.get('date', ''),
             'asin': release.get('asin', ''),
             'musicbrainz_albumid': release.get('id', ''),
+            'musicbrainz_discid': self.id,
          }
 
         tracks = {'album_info': album_info}
@@ -323,10 +348,7 @@ class CDMetaData(discid.Disc):
 
         self.log.debug("Getting recording's related works")
         try:
-            recording = musicbrainz.get_recording_by_id(
-                rid,
-                includes=['work-rels'],
-            )
+            recording = get_recording_works(rid)
         except Exception as err:
             self.log.error(
                 "Failed to get related works for recording: %s",
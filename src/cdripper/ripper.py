@@ -5,7 +5,7 @@ Utilities for ripping titles
 
 import logging
 import os
-import subprocess
+import threading
 from PyQt5 import QtCore
 
 from . import utils
@@ -19,12 +19,19 @@ class DiscHandler(QtCore.QObject):
 
     """
 
-    def __init__(self, dev: str, outdir=None, progress_dialog=None):
+    def __init__(
+        self,
+        dev: str,
+        outdir=None,
+        progress_dialog=None,
+        rip_sem=None,
+    ):
         super().__init__()
         self.log = logging.getLogger(__name__)
         self.dev = dev
         self.outdir = outdir
         self.progress_dialog = progress_dialog
+        self.rip_sem = rip_sem
 
         self.metadata = None
         self.selector = None
@@ -145,8 +152,8 @@ class DiscHandler(QtCore.QObject):
         self.metadata.FINISHED.connect(self.process_search)
         self.metadata.start()
 
-    @QtCore.pyqtSlot(str)
-    def process_search(self, dev: str) -> None:
+    @QtCore.pyqtSlot(str, str)
+    def process_search(self, dev: str, error: str) -> None:
         """
         Process result of disc ID search
 
@@ -157,21 +164,23 @@ class DiscHandler(QtCore.QObject):
 
         Arguments:
             dev (str): The dev device that was used to compute disc ID.
+            error (str): Error code from the search; empty string if no
+                error occurred.
 
         """
 
-        # Check for errors in search
-        error = ''
-        if dev.startswith('ERROR'):
-            error, dev = dev.split('-')
-
         # If dev does not match dev of class; dump out
         if dev != self.dev:
             return
 
-        # If there was an error; eject the drive
+        # If there was an error; eject the drive. Done in separate thread as
+        # eject can take a while and this runs in the GUI thread
         if error:
-            subprocess.call(['eject', self.dev])
+            threading.Thread(
+                target=utils.eject,
+                args=(self.dev,),
+                daemon=True,
+            ).start()
             return
 
         self.log.info("%s - Running select release", dev)
@@ -227,6 +236,7 @@ class DiscHandler(QtCore.QObject):
             self.outdir,
             media_label=media_label,
             progress=self.progress_dialog,
+            rip_sem=self.rip_sem,
         )
         self.ripper.start()
 
@@ -241,6 +251,7 @@ class Ripper(QtCore.QThread):
         outdir: str,
         media_label: bool = False,
         progress=None,
+        rip_sem=None,
     ):
         """
         Arguments:
@@ -253,6 +264,9 @@ class Ripper(QtCore.QThread):
         Keyword Arguments:
             media_label (bool): If set, use the media label over the title
                 of the album. Can be useful for multidisc collections
+            progress (ProgressDialog): Dialog to send rip progress to
+            rip_sem (QSemaphore): Semaphore shared between all rippers to
+                limit the number of concurrent rips
         """
 
         super().__init__()
@@ -267,6 +281,7 @@ class Ripper(QtCore.QThread):
         self.outdir = outdir
         self.media_label = media_label
         self.progress = progress
+        self.rip_sem = rip_sem
 
         self.progress.CANCEL.connect(self.terminate)
 
@@ -280,7 +295,7 @@ class Ripper(QtCore.QThread):
         if self.progress is not None:
             self.progress.CD_ADD_DISC.emit(self.dev, tracks)
 
-        # Replace path seperator with under score
+        # Build output directory from sanitized artist/album names
         album_artist = tracks['album_info'].get('albumartist', 'Unknown')
         album_title = tracks['album_info'].get('album', 'Unknown')
         if self.media_label:
@@ -288,27 +303,44 @@ class Ripper(QtCore.QThread):
 
         outdir = os.path.join(
             self.outdir,
-            album_artist.replace(os.sep, '_'),
-            album_title.replace(os.sep, '_'),
+            utils.safe_path(album_artist),
+            utils.safe_path(album_title),
         )
 
-        self.proc = utils.cdparanoia(self.dev, self.tmpdir)
-        if self.progress is not None:
-            utils.cdparanoia_progress(self.dev, self.proc, self.progress)
-
-        _ = self.proc.communicate()
-        if self.proc.returncode == 0:
-            self.status = utils.convert2FLAC(
-                self.dev,
-                self.tmpdir,
-                outdir,
-                tracks,
-                media_label=self.media_label,
-            )
+        if self.rip_sem is not None:
+            self.rip_sem.acquire()
+        try:
+            # Rip may have been canceled while waiting for a free slot
+            if self._dead:
+                self.log.info("%s - Rip canceled before it started", self.dev)
+                if self.progress is not None:
+                    self.progress.CD_REMOVE_DISC.emit(self.dev)
+                utils.cleanup(self.tmpdir)
+                return
+
+            # The progress reader drains the output pipe, so just wait on
+            # the process; otherwise, communicate() to drain it
+            self.proc = utils.cdparanoia(self.dev, self.tmpdir)
+            if self.progress is not None:
+                utils.cdparanoia_progress(self.dev, self.proc, self.progress)
+                self.proc.wait()
+            else:
+                _ = self.proc.communicate()
+            if self.proc.returncode == 0 and not self._dead:
+                self.status = utils.convert2FLAC(
+                    self.dev,
+                    self.tmpdir,
+                    outdir,
+                    tracks,
+                    media_label=self.media_label,
+                )
+        finally:
+            if self.rip_sem is not None:
+                self.rip_sem.release()
 
         utils.cleanup(self.tmpdir)
 
-        subprocess.call(['eject', self.dev])
+        utils.eject(self.dev)
 
         self.log.info("%s - Ripper thread finished", self.dev)
 
@@ -4,13 +4,16 @@ Utilities for ripping titles
 """
 
 import logging
-import signal
-from threading import Event
+import os
+import select
+import time
+import functools
 from PyQt5 import QtCore
 
 import pyudev
 
 from .ripper import DiscHandler
+from .ui.utils import get_vendor_model
 
 KEY = 'DEVNAME'
 CHANGE = 'DISK_MEDIA_CHANGE'
@@ -19,12 +22,20 @@ STATUS = "ID_CDROM_MEDIA_STATE"
 EJECT = "DISK_EJECT_REQUEST"  # This appears when initial eject requested
 READY = "SYSTEMD_READY"  # This appears when disc tray is out
 
+# Minimum time between insert events for a drive; seconds
+DEBOUNCE = 0.5
+
+# Properties used to determine type of event
+EVENT_PROPS = (EJECT, READY, CHANGE, STATUS)
+
 SIZE_POLL = 10
 
-RUNNING = Event()
 
-signal.signal(signal.SIGINT, lambda *args: RUNNING.set())
-signal.signal(signal.SIGTERM, lambda *args: RUNNING.set())
+@functools.cache
+def _udev_context():
+    """Shared pyudev context; created on first use"""
+
+    return pyudev.Context()
 
 
 class UdevWatchdog(QtCore.QThread):
@@ -57,6 +68,9 @@ class UdevWatchdog(QtCore.QThread):
     """
 
     HANDLE_DISC = QtCore.pyqtSignal(str)
+    # Emitted when the thread was woken by a signal (e.g., SIGINT/SIGTERM)
+    # rather than by quit(); the application should shut down
+    SIGNALED = QtCore.pyqtSignal()
 
     def __init__(
         self,
@@ -90,16 +104,34 @@ class UdevWatchdog(QtCore.QThread):
         self.__log = logging.getLogger(__name__)
         self.__log.debug("%s started", __name__)
 
-        self.HANDLE_DISC.connect(self.handle_disc)
+        # Emitted from watchdog thread; always queue to the GUI thread
+        self.HANDLE_DISC.connect(
+            self.handle_disc,
+            QtCore.Qt.QueuedConnection,
+        )
         self._outdir = None
 
         self.outdir = outdir
         self.progress_dialog = progress_dialog
 
+        # Limit number of concurrent rips so FLAC encoders do not thrash
+        self._rip_sem = QtCore.QSemaphore(max(1, (os.cpu_count() or 1) // 2))
+
         self._mounted = {}
-        self._context = pyudev.Context()
-        self._monitor = pyudev.Monitor.from_netlink(self._context)
-        self._monitor.filter_by(subsystem='block')
+        self._last_seen = {}
+        # Pipe written to by quit() to wake and stop the thread. A pipe is
+        # used so that it can also be the signal wakeup fd; see wakeup_fd
+        self._wake_r, self._wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        self._context = _udev_context()
+
+        # Use udev (not kernel) events; only those carry the udev-derived
+        # properties (CDTYPE, READY, STATUS) used to classify events
+        self._monitor = pyudev.Monitor.from_netlink(
+            self._context,
+            source='udev',
+        )
+        # Optical drives are whole 'disk' devices; drop partitions, etc.
+        self._monitor.filter_by(subsystem='block', device_type='disk')
 
     @property
     def outdir(self):
@@ -129,74 +161,128 @@ class UdevWatchdog(QtCore.QThread):
         """
         Processing for thread
 
-        Polls udev for device changes, running MakeMKV pipelines
-        when dvd/bluray found
+        Blocks on the udev monitor and a wakeup pipe, so the thread sleeps
+        until either a device event arrives or quit() is called. All pending
+        device events are handled on each wakeup.
 
         """
 
         self.__log.info('Watchdog thread started')
-        while not RUNNING.is_set():
-            device = self._monitor.poll(timeout=1.0)
-            if device is None:
-                continue
-
-            # Get value for KEY. If is None, then did not exist, so continue
-            dev = device.properties.get(KEY, None)
-            if dev is None:
-                continue
-
-            # Every optical drive should support CD, so check if the device
-            # has the CDTYPE flag, if not we ignore it
-            if device.properties.get(CDTYPE, '') != '1':
-                continue
-
-            if device.properties.get(EJECT, ''):
-                self.__log.debug("%s - Eject request", dev)
-                self._ejecting(dev)
-                continue
-
-            if device.properties.get(READY, '') == '0':
-                self.__log.debug("%s - Drive is ejected", dev)
-                self._ejecting(dev)
-                continue
-
-            if device.properties.get(CHANGE, '') != '1':
-                self.__log.debug(
-                    "%s - Not a '%s' event, ignoring",
-                    dev,
-                    CHANGE,
-                )
-                continue
-
-            # The STATUS key does not seem to exist for CD
-            if device.properties.get(STATUS, '') != '':
-                self.__log.debug(
-                    '%s - Caught event that was NOT insert/eject, ignoring',
-                    dev,
-                )
-                continue
-
-            if dev in self._mounted:
-                self.__log.info('%s - Device in mounted list', dev)
-                continue
-
-            self.__log.debug('%s - Finished mounting', dev)
-            self._mounted[dev] = None
-            self.HANDLE_DISC.emit(dev)
+        self._monitor.start()
+        monitor_fd = self._monitor.fileno()
+
+        poller = select.epoll()
+        poller.register(monitor_fd, select.EPOLLIN)
+        poller.register(self._wake_r, select.EPOLLIN)
+        try:
+            while True:
+                fds = [fd for fd, _ in poller.poll()]
+                if self._wake_r in fds:
+                    # quit() writes a null byte; the C-level signal handler
+                    # writes the (non-zero) signal number
+                    if any(os.read(self._wake_r, 512)):
+                        self.SIGNALED.emit()
+                    break
+                if monitor_fd not in fds:
+                    continue
+                for device in iter(
+                    functools.partial(self._monitor.poll, 0),
+                    None,
+                ):
+                    self._process_device(device)
+        finally:
+            poller.close()
+        self.__log.info('Watchdog thread stopped')
+
+    def _process_device(self, device):
+        """
+        Handle a single udev device event
 
-    def _ejecting(self, dev):
+        Arguments:
+            device (pyudev.Device): Device that generated the event
 
-        proc = self._mounted.pop(dev, None)
-        if proc is None:
+        """
+
+        # Grab properties once and bind lookup method used below
+        get = device.properties.get
+
+        # Every optical drive should support CD, so check if the device
+        # has the CDTYPE flag, if not we ignore it. This is checked first
+        # as it rejects most events with a single property lookup
+        if get(CDTYPE, '') != '1':
+            return
+
+        # Get value for KEY. If is None, then did not exist, so return
+        dev = get(KEY, None)
+        if dev is None:
+            return
+
+        # Drive itself removed (e.g., USB drive unplugged); another drive may
+        # later get the same dev node, so drop cached vendor/model info
+        if device.action == 'remove':
+            self.__log.debug("%s - Drive removed", dev)
+            get_vendor_model.cache_clear()
+            return
+
+        eject, ready, change, status = [
+            get(key, '') for key in EVENT_PROPS
+        ]
+
+        if eject or ready == '0':
+            self.__log.debug("%s - Eject request or drive ejected", dev)
+            self._ejecting(dev)
             return
 
-        if proc.isRunning():
+        # Only media change events are of interest; the STATUS key does
+        # not seem to exist for CD
+        if change != '1' or status != '':
+            return
+
+        # Drives can send a burst of change events for one insert; ignore
+        # any that come too soon after the last accepted one
+        now = time.monotonic()
+        if now - self._last_seen.get(dev, 0.0) < DEBOUNCE:
+            return
+        self._last_seen[dev] = now
+
+        # Reserve the dev with a placeholder until the handler is created.
+        # If setdefault does not return our placeholder, then the drive was
+        # already being handled, so skip it
+        placeholder = object()
+        if self._mounted.setdefault(dev, placeholder) is not placeholder:
+            return
+
+        self.__log.debug('%s - Finished mounting', dev)
+        self.HANDLE_DISC.emit(dev)
+
+    def _ejecting(self, dev):
+
+        # Value may be placeholder object if handler not yet created
+        proc = self._mounted.pop(dev, None)
+        if isinstance(proc, DiscHandler) and proc.isRunning():
             self.__log.warning("%s - Killing the ripper process!", dev)
             proc.terminate()
-            return
+
+    @property
+    def wakeup_fd(self) -> int:
+        """
+        Write end of the wakeup pipe
+
+        Can be passed to signal.set_wakeup_fd() so that signals stop the
+        thread, and SIGNALED is emitted, even while the main thread is
+        blocked in the Qt event loop.
+
+        """
+
+        return self._wake_w
 
     def quit(self, *args, **kwargs):
-        RUNNING.set()
+        """Wake the watchdog thread so that it exits"""
+
+        try:
+            os.write(self._wake_w, b'\0')
+        except BlockingIOError:
+            pass  # Pipe full; thread already has a pending wakeup
 
     @QtCore.pyqtSlot(str)
     def handle_disc(self, dev: str):
@@ -205,4 +291,5 @@ class UdevWatchdog(QtCore.QThread):
             dev,
             self.outdir,
             self.progress_dialog,
+            rip_sem=self._rip_sem,
         )
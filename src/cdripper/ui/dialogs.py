@@ -1,5 +1,7 @@
 import logging
 import os
+import math
+import functools
 
 from PyQt5 import QtWidgets
 from PyQt5 import QtCore
@@ -9,6 +11,12 @@ from PyQt5 import QtGui
 from .. import NAME
 from . import utils
 
+DISPLAY_ROLE = QtCore.Qt.DisplayRole
+
+# Cache of theme/style icons; populated on first use. See get_theme_icon()
+# and get_standard_icon()
+_ICONS = {}
+
 # Codes for what to do
 SUBMIT = 3
 SUBMITTED = 2
@@ -16,6 +24,53 @@ RIP = 1
 IGNORE = 0
 
 
+def get_theme_icon(name: str) -> QtGui.QIcon:
+    """
+    Get icon from the icon theme
+
+    Theme lookups scan the icon theme index files, so icons are cached
+    after first use. Must not be called before the QApplication exists.
+
+    Arguments:
+        name (str): Name of the theme icon
+
+    Returns:
+        QIcon: The icon
+
+    """
+
+    icon = _ICONS.get(name, None)
+    if icon is None:
+        icon = _ICONS[name] = QtGui.QIcon.fromTheme(name)
+    return icon
+
+
+def get_standard_icon(pixmap: QtWidgets.QStyle.StandardPixmap) -> QtGui.QIcon:
+    """
+    Get standard icon from the application style
+
+    Icons are cached after first use. Must not be called before the
+    QApplication exists.
+
+    Arguments:
+        pixmap (QStyle.StandardPixmap): The standard icon to get
+
+    Returns:
+        QIcon: The icon
+
+    """
+
+    icon = _ICONS.get(pixmap, None)
+    if icon is None:
+        icon = _ICONS[pixmap] = (
+            QtWidgets
+            .QApplication
+            .style()
+            .standardIcon(pixmap)
+        )
+    return icon
+
+
 class MissingOutdirDialog(QtWidgets.QDialog):
     def __init__(self, outdir, name=NAME):
         super().__init__()
@@ -33,15 +88,10 @@ class MissingOutdirDialog(QtWidgets.QDialog):
         self.buttonBox.rejected.connect(self.reject)
 
         self.layout = QtWidgets.QVBoxLayout()
-        message = (
-            "Could not find the requested output directory: ",
-            os.linesep,
-            outdir,
-            os.linesep,
-            "Would you like to select a new one?",
-        )
         message = QtWidgets.QLabel(
-            os.linesep.join(message)
+            "Could not find the requested output directory:\n"
+            f"{outdir}\n"
+            "Would you like to select a new one?"
         )
         self.layout.addWidget(message)
         self.layout.addWidget(self.buttonBox)
@@ -50,12 +100,12 @@ class MissingOutdirDialog(QtWidgets.QDialog):
 
 class SettingsWidget(QtWidgets.QDialog):
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, settings: dict, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.outdir = PathSelector('Output Location:')
 
-        self.set_settings()
+        self.set_settings(settings)
 
         buttons = (
             QtWidgets.QDialogButtonBox.Save
@@ -70,19 +120,16 @@ class SettingsWidget(QtWidgets.QDialog):
         layout.addWidget(button_box)
         self.setLayout(layout)
 
-    def set_settings(self):
+    def set_settings(self, settings: dict):
 
-        settings = utils.load_settings()
         if 'outdir' in settings:
             self.outdir.setText(settings['outdir'])
 
     def get_settings(self):
 
-        settings = {
+        return {
             'outdir': self.outdir.getText(),
         }
-        utils.save_settings(settings)
-        return settings
 
 
 class SelectDisc(QtWidgets.QDialog):
@@ -151,9 +198,14 @@ class SelectDisc(QtWidgets.QDialog):
             "\tIgnore: Ignore the disc and do nothing?\n"
         )
 
+        # Build countdown labels once; indexed by number of seconds remaining
         self.timeout_fmt = "Disc will begin ripping in: {:>4d} seconds"
+        self._labels = [
+            self.timeout_fmt.format(i)
+            for i in range(math.ceil(self._timeout) + 1)
+        ]
         self.timeout_label = QtWidgets.QLabel(
-            self.timeout_fmt.format(self._timeout)
+            self._labels[math.ceil(self._timeout)]
         )
 
         # Set up model for table containing releases
@@ -186,32 +238,41 @@ class SelectDisc(QtWidgets.QDialog):
         vendor, model = utils.get_vendor_model(self.dev)
         self.setWindowTitle(f"{self._name} - {vendor} {model}")
 
-        # Set timeout timer
+        # Set timer to rip on timeout, and timer to update countdown label.
+        # The label timer runs faster than once per second, but the label
+        # is only updated when the number of seconds remaining changes
+        timeout_ms = int(self._timeout * 1000)
+        self._deadline = QtCore.QDeadlineTimer(timeout_ms)
+        self._last_shown = math.ceil(self._timeout)
+
+        self._rip_timer = QtCore.QTimer()
+        self._rip_timer.setSingleShot(True)
+        self._rip_timer.timeout.connect(functools.partial(self.done, RIP))
+        self._rip_timer.start(timeout_ms)
+
         self._timer = QtCore.QTimer()
         self._timer.timeout.connect(self._message_timeout)
-        self._timer.start(1000)
+        self._timer.start(250)
         self.show()
 
     def _message_timeout(self) -> None:
         """
-        Timeout method
+        Update countdown label
 
-        This method is called every time the timer times out (every second).
-        When called, the timeout attribute is decremented by one. While the
-        timeout is geater than zero, we update the QLabel for time remaining
-        and return, otherwise, we stop the timer and call the done method.
+        This method is called every time the label timer times out. The
+        number of seconds remaining before the rip timer fires is computed
+        and, if it has changed since the last call, the QLabel for time
+        remaining is updated.
 
         """
 
-        self._timeout -= 1
-        if self._timeout > 0:
-            self.timeout_label.setText(
-                self.timeout_fmt.format(self._timeout)
-            )
+        # Round up remaining milliseconds to whole seconds
+        remaining = max(0, (self._deadline.remainingTime() + 999) // 1000)
+        if remaining == self._last_shown:
             return
 
-        self._timer.stop()
-        self.done(RIP)
+        self._last_shown = remaining
+        self.timeout_label.setText(self._labels[remaining])
 
     def action(self, button) -> None:
         """
@@ -229,7 +290,8 @@ class SelectDisc(QtWidgets.QDialog):
 
         """
 
-        # Stop timer
+        # Stop timers
+        self._rip_timer.stop()
         self._timer.stop()
 
         # If button has HelpRole, then erase timer label and return
@@ -260,6 +322,10 @@ class SelectDisc(QtWidgets.QDialog):
 
         """
 
+        # Stop timers in case done() was not triggered by them
+        self._rip_timer.stop()
+        self._timer.stop()
+
         # Call super class done method
         super().done(arg)
 
@@ -267,7 +333,7 @@ class SelectDisc(QtWidgets.QDialog):
         release = {}
         if arg == RIP:
             row = self.table.selectionModel().selectedRows()[0].row()
-            release = self.model.releases[row]
+            release = self.model.get_release(row)
 
         # Emit signal
         self.FINISHED.emit(
@@ -303,7 +369,7 @@ class SubmitDisc(QtWidgets.QDialog):
         self._name = name
 
         # Set up botton (with icon) to trigger open of URL in browser
-        self.icon = QtGui.QIcon.fromTheme("media-optical")
+        self.icon = get_theme_icon("media-optical")
         self.submit_button = QtWidgets.QToolButton()
         self.submit_button.setIcon(self.icon)
         self.submit_button.setIconSize(QtCore.QSize(128, 128))
@@ -463,7 +529,7 @@ class MyTableModel(QtCore.QAbstractTableModel):
         super().__init__(parent)
 
         # Column names
-        self.columns = [
+        self.columns = (
             'Release Title',
             'Medium Title',
             'Disc Number',
@@ -472,37 +538,54 @@ class MyTableModel(QtCore.QAbstractTableModel):
             'Country',
             'Date',
             'Barcode',
+        )
+
+        # Flatten releases into (release, medium) pairs so that each medium
+        # of a release is its own row in the table; the flattened release
+        # object is only built for the selected row. See get_release()
+        self.releases = [
+            (release, medium)
+            for release in releases
+            for medium in release['medium-list']
         ]
 
-        # Iterate to create table rows and flattend information for releases.
-        # The flattened release informaiton is created by expanding each
-        # medium object in the list of mediums for a release into its own
-        # "release" object.
-        data = []
-        releases_flat = []
-        for release in releases:
-            for medium in release['medium-list']:
-                release_flat = release.copy()
-                release_flat['medium-list'] = medium
-                releases_flat.append(release_flat)
-                discnum = (
-                    str(medium.get('position', '1')),
-                    str(release.get('medium-count', '1')),
-                )
-                info = [
-                    release.get('title', ''),
-                    medium.get('title', ''),
-                    '/'.join(discnum),
-                    release.get('artist-credit-phrase', ''),
-                    medium.get('format', '??'),
-                    release.get('country', '??'),
-                    release.get('date', '??'),
-                    release.get('barcode', ''),
-                ]
-                data.append(info)
-
-        self.data = data
-        self.releases = releases_flat
+        # Rows are immutable tuples of strings
+        self._rows = tuple(
+            (
+                release.get('title', ''),
+                medium.get('title', ''),
+                f"{medium.get('position', '1')}/"
+                f"{release.get('medium-count', '1')}",
+                release.get('artist-credit-phrase', ''),
+                medium.get('format', '??'),
+                release.get('country', '??'),
+                release.get('date', '??'),
+                release.get('barcode', ''),
+            )
+            for release, medium in self.releases
+        )
+
+        # Table size is fixed, so compute once rather than on every repaint
+        self._rowcount = len(self._rows)
+        self._colcount = len(self.columns)
+
+    def get_release(self, row: int) -> dict:
+        """
+        Get release information for given row
+
+        Arguments:
+            row (int): Row of the table
+
+        Returns:
+            dict: Copy of the release with 'medium-list' set to the single
+                medium of the row
+
+        """
+
+        release, medium = self.releases[row]
+        release = release.copy()
+        release['medium-list'] = medium
+        return release
 
     def headerData(
         self,
@@ -516,13 +599,12 @@ class MyTableModel(QtCore.QAbstractTableModel):
             return ""
 
     def columnCount(self, parent=None):
-        return len(self.data[0])
+        return self._colcount
 
     def rowCount(self, parent=None):
-        return len(self.data)
+        return self._rowcount
 
     def data(self, index: QtCore.QModelIndex, role: int):
-        if role == QtCore.Qt.DisplayRole:
-            row = index.row()
-            col = index.column()
-            return str(self.data[row][col])
+        # All values are strings already; see __init__
+        if role == DISPLAY_ROLE:
+            return self._rows[index.row()][index.column()]
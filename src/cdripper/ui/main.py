@@ -1,7 +1,9 @@
 import logging
 import sys
 import os
+import signal
 import argparse
+import functools
 
 from PyQt5 import QtWidgets
 from PyQt5 import QtCore
@@ -20,19 +22,11 @@ class SystemTray(QtWidgets.QSystemTrayIcon):
     """
 
     def __init__(self, app, name=NAME):
-        icon = (
-            QtWidgets.
-            QApplication
-            .style()
-            .standardIcon(
-                QtWidgets.QStyle.SP_DriveDVDIcon
-            )
-        )
+        icon = dialogs.get_standard_icon(QtWidgets.QStyle.SP_DriveDVDIcon)
         super().__init__(icon, app)
 
         self.__log = logging.getLogger(__name__)
         self._name = name
-        self._settingsInfo = None
         self._app = app
         self._menu = QtWidgets.QMenu()
 
@@ -55,12 +49,19 @@ class SystemTray(QtWidgets.QSystemTrayIcon):
         self.setContextMenu(self._menu)
         self.setVisible(True)
 
-        settings = utils.load_settings()
+        # Settings are loaded once and kept in memory
+        self._settingsInfo = utils.load_settings()
 
         self.progress = progress.ProgressDialog()
         self.ripper = udev_watchdog.UdevWatchdog(
             progress_dialog=self.progress,
-            **settings,
+            **self._settingsInfo,
+        )
+        # Signals wake the watchdog thread, which then asks the GUI thread to
+        # shut down; see cli()
+        self.ripper.SIGNALED.connect(
+            functools.partial(self.quit, force=True),
+            QtCore.Qt.QueuedConnection,
         )
         self.ripper.start()
 
@@ -74,24 +75,21 @@ class SystemTray(QtWidgets.QSystemTrayIcon):
     def settings_widget(self, *args, **kwargs):
 
         self.__log.debug('opening settings')
-        settings_widget = dialogs.SettingsWidget()
+        settings_widget = dialogs.SettingsWidget(self._settingsInfo)
         if settings_widget.exec_():
-            self.ripper.set_settings(
-                **settings_widget.get_settings(),
+            self._settingsInfo.update(
+                settings_widget.get_settings(),
             )
+            self.ripper.set_settings(**self._settingsInfo)
+            utils.save_settings(self._settingsInfo)
 
     def quit(self, *args, **kwargs):
         """Display quit confirm dialog"""
-        self.__log.info('Saving settings')
-
-        utils.save_settings(
-            self.ripper.get_settings(),
-        )
 
         if kwargs.get('force', False):
             self.__log.info('Force quit')
-            self.ripper.quit()
-            self._app.quit()
+            self._shutdown()
+            return
 
         msg = QtWidgets.QMessageBox()
         msg.setIcon(QtWidgets.QMessageBox.Warning)
@@ -103,8 +101,16 @@ class SystemTray(QtWidgets.QSystemTrayIcon):
         )
         res = msg.exec_()
         if res == QtWidgets.QMessageBox.Yes:
-            self.ripper.quit()
-            self._app.quit()
+            self._shutdown()
+
+    def _shutdown(self):
+        """Save settings and quit application"""
+
+        self.__log.info('Saving settings')
+        utils.save_settings(self._settingsInfo)
+        self.ripper.quit()
+        self.ripper.wait()
+        self._app.quit()
 
     def check_outdir_exists(self):
         """
@@ -112,26 +118,22 @@ class SystemTray(QtWidgets.QSystemTrayIcon):
 
         """
 
-        if os.path.isdir(self.ripper.outdir):
-            return
+        while not os.path.isdir(self.ripper.outdir):
+            dlg = dialogs.MissingOutdirDialog(self.ripper.outdir)
+            if not dlg.exec_():
+                self.quit(force=True)
+                return
 
-        dlg = dialogs.MissingOutdirDialog(self.ripper.outdir)
-        if not dlg.exec_():
-            self.quit(force=True)
-            return
-
-        path = QtWidgets.QFileDialog.getExistingDirectory(
-            QtWidgets.QDialog(),
-            f'{self._name}: Select Output Folder',
-        )
-        if path != '':
-            self.ripper.outdir = path
-            utils.save_settings(
-                self.ripper.get_settings(),
+            # No parent widget; the tray icon is not a QWidget
+            path = QtWidgets.QFileDialog.getExistingDirectory(
+                None,
+                f'{self._name}: Select Output Folder',
             )
-            return
-
-        self.check_outdir_exists()
+            if path != '':
+                self.ripper.outdir = path
+                self._settingsInfo['outdir'] = path
+                utils.save_settings(self._settingsInfo)
+                return
 
 
 def cli():
@@ -150,5 +152,14 @@ def cli():
 
     app = QtWidgets.QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
-    _ = SystemTray(app)
+    tray = SystemTray(app)
+
+    # Python-level handlers do not run while the Qt event loop is blocked,
+    # so have the C-level handler write to the watchdog's wakeup pipe. The
+    # watchdog then emits SIGNALED, which quits the application from the
+    # GUI thread
+    signal.signal(signal.SIGINT, tray.ripper.quit)
+    signal.signal(signal.SIGTERM, tray.ripper.quit)
+    signal.set_wakeup_fd(tray.ripper.wakeup_fd)
+
     app.exec_()
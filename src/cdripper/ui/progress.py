@@ -1,4 +1,6 @@
 import logging
+import html
+import time
 
 from PyQt5 import QtWidgets
 from PyQt5 import QtCore
@@ -6,6 +8,9 @@ from PyQt5 import QtCore
 from .. import NAME
 from .utils import get_vendor_model
 
+# Minimum time between progress bar updates; ~20 Hz
+UPDATE_INTERVAL = 50  # milliseconds
+
 
 class ProgressDialog(QtWidgets.QWidget):
 
@@ -34,42 +39,92 @@ class ProgressDialog(QtWidgets.QWidget):
         self.setWindowTitle(f"{NAME} - Rip Progress")
 
         self.widgets = {}
+        # Last (dev, widget) looked up; most systems have a single drive
+        self._last = (None, None)
+        # Set when a resize is queued for the next event loop iteration
+        self._adjust_pending = False
         self.layout = QtWidgets.QVBoxLayout()
         self.setLayout(self.layout)
 
-        self.CD_ADD_DISC.connect(self.cd_add_disc)
-        self.CD_REMOVE_DISC.connect(self.cd_remove_disc)
-        self.CD_CUR_TRACK.connect(self.cd_current_track)
-        self.CD_TRACK_SIZE.connect(self.cd_track_size)
+        # Signals are emitted from ripper threads; always queue to GUI thread
+        queued = QtCore.Qt.QueuedConnection
+        self.CD_ADD_DISC.connect(self.cd_add_disc, queued)
+        self.CD_REMOVE_DISC.connect(self.cd_remove_disc, queued)
+        self.CD_CUR_TRACK.connect(self.cd_current_track, queued)
+        self.CD_TRACK_SIZE.connect(self.cd_track_size, queued)
 
     def __len__(self):
         return len(self.widgets)
 
+    def _get_widget(self, dev: str):
+        """
+        Get progress widget for dev device
+
+        The last widget looked up is cached so that the dict lookup is
+        skipped for the repeated updates for the same drive.
+
+        """
+
+        if dev == self._last[0]:
+            return self._last[1]
+
+        widget = self.widgets.get(dev, None)
+        self._last = (dev, widget)
+        return widget
+
     @QtCore.pyqtSlot(str, dict)
     def cd_add_disc(self, dev: str, info: dict):
         self.log.debug("%s - Disc addeds", dev)
         widget = ProgressWidget(dev, info)
         widget.CANCEL.connect(self.cancel)
 
-        self.layout.addWidget(widget)
-        self.widgets[dev] = widget
-        self.show()
-        self.adjustSize()
+        # Paint the dialog once with the new widget in place
+        self.setUpdatesEnabled(False)
+        try:
+            self.layout.addWidget(widget)
+            self.widgets[dev] = widget
+            self._last = (dev, widget)
+            self.show()
+        finally:
+            self.setUpdatesEnabled(True)
+        self._schedule_adjust()
 
     @QtCore.pyqtSlot(str)
     def cd_remove_disc(self, dev: str):
         widget = self.widgets.pop(dev, None)
+        if dev == self._last[0]:
+            self._last = (None, None)
         if widget is not None:
-            self.layout.removeWidget(widget)
+            widget.stop()
+            # Un-parenting drops widget from layout; no explicit removeWidget
+            widget.setParent(None)
             widget.deleteLater()
             self.log.debug("%s - Disc removed", dev)
         if len(self.widgets) == 0:
             self.setVisible(False)
+        self._schedule_adjust()
+
+    def _schedule_adjust(self):
+        """
+        Queue resize of dialog to fit its widgets
+
+        Discs added/removed in quick succession result in a single
+        adjustSize() call once control returns to the event loop.
+
+        """
+
+        if self._adjust_pending:
+            return
+        self._adjust_pending = True
+        QtCore.QTimer.singleShot(0, self._do_adjust)
+
+    def _do_adjust(self):
+        self._adjust_pending = False
         self.adjustSize()
 
     @QtCore.pyqtSlot(str, str)
     def cd_current_track(self, dev: str, title: str):
-        widget = self.widgets.get(dev, None)
+        widget = self._get_widget(dev)
         if widget is None:
             return
         self.log.debug("%s - Setting current track: %s", dev, title)
@@ -77,10 +132,12 @@ class ProgressDialog(QtWidgets.QWidget):
 
     @QtCore.pyqtSlot(str, int)
     def cd_track_size(self, dev, tsize):
-        widget = self.widgets.get(dev, None)
+        widget = self._get_widget(dev)
         if widget is None:
             return
-        self.log.debug("%s - Update current track size: %d", dev, tsize)
+        # Called on every progress update, so skip logging call unless needed
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("%s - Update current track size: %d", dev, tsize)
         widget.track_size(tsize)
 
     @QtCore.pyqtSlot(str)
@@ -110,8 +167,24 @@ class ProgressWidget(QtWidgets.QFrame):
         )
         self.setLineWidth(1)
 
-        self.track_progs = []
+        # One progress slot per track, looked up by track number so that a
+        # re-reported track does not throw off the running total
+        self._track_index = {
+            title: i
+            for i, title in enumerate(
+                key for key in info if key != 'album_info'
+            )
+        }
+        self.track_progs = [0] * len(self._track_index)
+        self.track_total = 0
         self.current_title = None
+        self._current = None
+
+        # Timer to flush progress updates dropped by rate limiting
+        self._last_update_ns = 0
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self.update_progress)
         self.dev = dev
         self.info = info
 
@@ -127,16 +200,15 @@ class ProgressWidget(QtWidgets.QFrame):
             f"Device: {vendor} {model} [{dev}]",
         )
 
-        # Set up label for name of the artist
-        self.artist_label = QtWidgets.QLabel("Artist:")
-        self.artist = QtWidgets.QLabel(
-            album_info.get('artist', 'NA')
-        )
-
-        # Set up label for name of the album
-        self.album_label = QtWidgets.QLabel("Album:")
-        self.album = QtWidgets.QLabel(
-            album_info.get('album', 'NA')
+        # Static release details in single rich-text label
+        self.details = QtWidgets.QLabel(
+            "<b>Artist:</b> {}<br><b>Album:</b> {}<br><b>Disc:</b> {}/{}"
+            .format(
+                html.escape(album_info.get('artist', 'NA')),
+                html.escape(album_info.get('album', 'NA')),
+                disc_num,
+                tot_discs,
+            )
         )
 
         # Set up label for name of the track being ripped
@@ -148,12 +220,6 @@ class ProgressWidget(QtWidgets.QFrame):
             f"[of {tot_tracks}]"
         )
 
-        # Set label for disc number/total number of discs
-        self.disc_count_label = QtWidgets.QLabel("Disc:")
-        self.disc_count = QtWidgets.QLabel(
-            f"{disc_num}/{tot_discs}"
-        )
-
         # Set up progress bar for rip of track
         self.track_prog = QtWidgets.QProgressBar()
         self.track_prog.setRange(0, 100)
@@ -162,7 +228,7 @@ class ProgressWidget(QtWidgets.QFrame):
         # Set up progress bar for overall disc rip
         self.disc_label = QtWidgets.QLabel('Overall Progress')
         self.disc_prog = QtWidgets.QProgressBar()
-        self.disc_prog.setRange(0, len(info) * 100)
+        self.disc_prog.setRange(0, len(self.track_progs) * 100)
         self.disc_prog.setValue(0)
 
         # Button to cancel ripping
@@ -172,19 +238,12 @@ class ProgressWidget(QtWidgets.QFrame):
         layout = QtWidgets.QGridLayout()
         layout.addWidget(self.drive_name, 0, 0, 1, 3)
 
-        layout.addWidget(self.artist_label, 10, 0)
-        layout.addWidget(self.artist, 10, 1)
-
-        layout.addWidget(self.album_label, 11, 0)
-        layout.addWidget(self.album, 11, 1)
+        layout.addWidget(self.details, 10, 0, 1, 3)
 
         layout.addWidget(self.track_label, 12, 0)
         layout.addWidget(self.track, 12, 1)
         layout.addWidget(self.track_count, 12, 2)
 
-        layout.addWidget(self.disc_count_label, 13, 0)
-        layout.addWidget(self.disc_count, 13, 1)
-
         layout.addWidget(self.track_prog, 15, 0, 1, 3)
         layout.addWidget(self.disc_label, 20, 0, 1, 3)
         layout.addWidget(self.disc_prog, 21, 0, 1, 3)
@@ -195,16 +254,27 @@ class ProgressWidget(QtWidgets.QFrame):
     def __len__(self):
         return len(self.info)
 
+    def stop(self):
+        """
+        Stop all updates from widget
+
+        Blocks signals (e.g., CANCEL) and stops any pending progress bar
+        update. Meant to be called before the widget is deleted.
+
+        """
+
+        self.blockSignals(True)
+        self._update_timer.stop()
+
     def cancel(self, *args, **kwargs):
 
-        message = QtWidgets.QMessageBox()
-        res = message.question(
+        res = QtWidgets.QMessageBox.question(
             self,
             '',
             "Are you sure you want to cancel the rip?",
-            message.Yes | message.No,
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
         )
-        if res == message.Yes:
+        if res == QtWidgets.QMessageBox.Yes:
             self.CANCEL.emit(self.dev)
 
     def current_track(self, title: str):
@@ -218,39 +288,70 @@ class ProgressWidget(QtWidgets.QFrame):
 
         """
 
-        # If the current_title is not None, then refers to previously
-        # processed track and must update the total size of that track
-        # to be maximum size of the track
-        if self.current_title is not None:
-            self.track_prog.setValue(100)
-            self.track_progs[-1] = 100
-
-        self.track_progs.append(0)
-        info = self.info.get(title, {})
-        if len(info) == 0:
-            self.log.error(
-                "%s - Missing track info for track # %s",
-                self.dev,
-                title,
+        # Suspend painting so that the progress bars and track label are
+        # redrawn once for the track change
+        self.setUpdatesEnabled(False)
+        try:
+            # If there is a current track, then refers to previously
+            # processed track and must update the total size of that track
+            # to be maximum size of the track
+            if self._current is not None:
+                self.track_total += 100 - self.track_progs[self._current]
+                self.track_progs[self._current] = 100
+
+            self._current = self._track_index.get(title, None)
+            info = self.info.get(title, {})
+            if len(info) == 0:
+                self.log.error(
+                    "%s - Missing track info for track # %s",
+                    self.dev,
+                    title,
+                )
+
+            self.track.setText(
+                f"{title} - {info.get('title', 'N/A')}",
             )
 
-        self.track.setText(
-            f"{title} - {info.get('title', 'N/A')}",
-        )
-
-        self.current_title = title
+            self.current_title = title
+            self.update_progress()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def track_size(self, tsize: int):
         """
         Update track size progress
 
-        Updat
+        Progress bars are updated at most once every UPDATE_INTERVAL. If an
+        update arrives sooner than that, a timer is armed so that the latest
+        value is still displayed. A completed track is always drawn
+        immediately.
+
+        Arguments:
+            tsize (int): Percent of current track that is ripped
 
         """
 
-        if len(self.track_progs) == 0:
+        idx = self._current
+        if idx is None or tsize == self.track_progs[idx]:
             return
 
-        self.track_progs[-1] = tsize
-        self.track_prog.setValue(tsize)
-        self.disc_prog.setValue(sum(self.track_progs))
+        # Keep running total of progress rather than summing every update
+        self.track_total += tsize - self.track_progs[idx]
+        self.track_progs[idx] = tsize
+
+        elapsed = time.monotonic_ns() - self._last_update_ns
+        if tsize < 100 and elapsed < UPDATE_INTERVAL * 1_000_000:
+            if not self._update_timer.isActive():
+                self._update_timer.start(UPDATE_INTERVAL)
+            return
+
+        self.update_progress()
+
+    def update_progress(self):
+        """Set progress bars to current track/disc progress"""
+
+        self._last_update_ns = time.monotonic_ns()
+        self.track_prog.setValue(
+            0 if self._current is None else self.track_progs[self._current]
+        )
+        self.disc_prog.setValue(self.track_total)
@@ -1,19 +1,33 @@
 import logging
 import os
 import json
+import functools
 
 from .. import HOMEDIR, SETTINGS_FILE
 
+log = logging.getLogger(__name__)
+
+# Last settings written to/read from SETTINGS_FILE
+_last_saved = None
+
 
 def load_settings() -> dict:
     """
     Load dict from data JSON file
 
+    The file is only read the first time; later calls return a copy of the
+    settings last loaded or saved.
+
     Returns:
         dict: Settings data loaded from JSON file
 
     """
 
+    global _last_saved
+
+    if _last_saved is not None:
+        return dict(_last_saved)
+
     if not os.path.isfile(SETTINGS_FILE):
         settings = {
             'outdir': os.path.join(HOMEDIR, 'Music'),
@@ -21,33 +35,52 @@ def load_settings() -> dict:
         save_settings(settings)
         return settings
 
-    logging.getLogger(__name__).debug(
+    log.debug(
         'Loading settings from %s', SETTINGS_FILE,
     )
     with open(SETTINGS_FILE, 'r') as fid:
-        return json.load(fid)
+        settings = json.load(fid)
+
+    _last_saved = dict(settings)
+    return settings
 
 
 def save_settings(settings: dict) -> None:
     """
     Save dict to JSON file
 
+    Settings are written to a temporary file that is then moved over the
+    settings file so that the file is never left partially written. If the
+    settings match those last saved, nothing is written.
+
     Arguments:
         settings (dict): Settings to save to JSON file
 
     """
 
-    logging.getLogger(__name__).debug(
+    global _last_saved
+
+    if settings == _last_saved:
+        return
+
+    log.debug(
         'Saving settings to %s', SETTINGS_FILE,
     )
-    with open(SETTINGS_FILE, 'w') as fid:
-        json.dump(settings, fid)
+    tmp = f"{SETTINGS_FILE}.tmp"
+    with open(tmp, 'w') as fid:
+        json.dump(settings, fid, separators=(',', ':'))
+    os.replace(tmp, SETTINGS_FILE)
 
+    _last_saved = dict(settings)
 
+
+@functools.lru_cache(maxsize=16)
 def get_vendor_model(path: str) -> tuple[str]:
     """
     Get the vendor and model of drive
 
+    Results are cached as the vendor/model of a drive does not change.
+
     """
 
     path = os.path.join(
@@ -56,18 +89,16 @@ def get_vendor_model(path: str) -> tuple[str]:
         'device',
     )
 
-    vendor = os.path.join(path, 'vendor')
-    if os.path.isfile(vendor):
-        with open(vendor, mode='r') as iid:
-            vendor = iid.read()
-    else:
-        vendor = ''
-
-    model = os.path.join(path, 'model')
-    if os.path.isfile(model):
-        with open(model, mode='r') as iid:
-            model = iid.read()
-    else:
-        model = ''
-
-    return vendor.strip(), model.strip()
+    info = []
+    for name in ('vendor', 'model'):
+        try:
+            fd = os.open(os.path.join(path, name), os.O_RDONLY)
+        except OSError:
+            info.append('')
+            continue
+        try:
+            info.append(os.read(fd, 256).decode(errors='replace').strip())
+        finally:
+            os.close(fd)
+
+    return tuple(info)
@@ -1,15 +1,47 @@
 import logging
 import os
+import functools
 import re
+import fcntl
+import shutil
+import signal
 import tempfile
-import time
-import hashlib
-from subprocess import Popen, DEVNULL, PIPE, STDOUT
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from subprocess import Popen, PIPE, STDOUT, call
 
 TRACK_NUM = r"track(\d+)"
 CURRENT = rb"outputting to " + TRACK_NUM.encode()
 PROGRESS = rb"== PROGRESS == \[([^\|]*)\|"
 
+# Compiled versions of above patterns; used for every line of output
+TRACK_NUM_RE = re.compile(TRACK_NUM)
+NONSPACE_RE = re.compile(rb'\S')
+# Either a track change (group 1) or a progress bar (group 2)
+RECORD_RE = re.compile(CURRENT + rb"|" + PROGRESS)
+
+# Characters that are not safe in file/directory names
+PATH_TRANS = str.maketrans({c: '_' for c in f'/\\:*?"<>|\x00{os.sep}'})
+
+# Size of buffer for reading cdparanoia output; matches default Linux pipe
+# capacity so that a single read drains everything that is buffered
+READ_SIZE = 65536
+
+# ioctl request code for ejecting tray; from linux/cdrom.h
+CDROMEJECT = 0x5309
+
+# Track info keys that are not written to FLAC files as tags
+NON_TAG_KEYS = ('short_title', 'cover-art')
+
+# Maximum number of tracks to encode to FLAC at once, across all rips
+FLAC_WORKERS = os.cpu_count() or 1
+
+# Encoder pool shared by all rips so that concurrent rips do not start
+# more 'flac' processes than there are cores
+_FLAC_POOL = ThreadPoolExecutor(
+    max_workers=FLAC_WORKERS,
+    thread_name_prefix='flac',
+)
+
 
 def cdparanoia(dev, outdir):
     """
@@ -60,6 +92,9 @@ def convert2FLAC(
     """
     Convert wav files ripped from CD to FLAC
 
+    Tracks are encoded concurrently in a pool shared by all rips, so at
+    most FLAC_WORKERS 'flac' processes run at once.
+
     Arguments:
         srcdir (str): Top-level directory of ripped CD files.
         outdir (str): Top-level directory to store FLAC files in. Files will
@@ -84,7 +119,20 @@ def convert2FLAC(
     )
     os.makedirs(outdir, exist_ok=True)
 
+    # Cover art is the same for every track, so look it up once rather than
+    # popping it from each track's info
     coverart = None
+    for info in tracks.values():
+        if 'cover-art' in info:
+            coverart = info['cover-art']
+            cover_discnum = info.get('discnumber', 1)
+            cover_totaldiscs = info.get('totaldiscs', 1)
+            break
+
+    # If cover art info, add picture option to every flac command
+    picture = () if coverart is None else (f'--picture={coverart}',)
+
+    jobs = []
     # Zip the list of tracks and list of files in directory; iterate over them
     for track_num, infile in listdir(srcdir):
         info = tracks.get(track_num, None)
@@ -96,22 +144,10 @@ def convert2FLAC(
             os.remove(infile)
             continue
 
-        cmd = ['flac']  # Base command for conversion
-        # If cover art info, append picture option to flac command
-        if 'cover-art' in info:
-            coverart = info.pop('cover-art')
-            cmd.append(f'--picture={coverart}')
-
-        # Iterate over key/value pairs in info, append tag option to command
-        for key, val in info.items():
-            if key == 'short_title':
-                continue
-            cmd.append(f'--tag={key}={val}')
-
-        # Set basename for flac fil,e
+        # Set basename for flac file
         outfile = '{:02d} - {}.flac'.format(
             info['tracknumber'],
-            info['short_title'],
+            safe_path(info['short_title']),
         )
 
         # If more than one disc in the release, prepend disc number
@@ -120,29 +156,41 @@ def convert2FLAC(
             discnum = info.get('discnumber', 1)
             outfile = f"{discnum:d}-{outfile}"
 
-        # Replace path seperator with under score
-        outfile = outfile.replace(os.sep, '_')
-
         # Generate full file path
         outfile = os.path.join(outdir, outfile)
 
-        # Append output-name option to flac command
-        cmd.append(f'--output-name={outfile}')
-
-        # Append input file to command
-        cmd.append(infile)
-
-        log.debug("Running 'flac' command: %s", cmd)
-        proc = Popen(cmd, stdout=DEVNULL, stderr=STDOUT)
-        proc.wait()
-
-        if not os.path.isfile(outfile):
-            log.error("Failed to create file: %s", outfile)
+        # Build flac command; picture, tags, output name, then input file
+        cmd = [
+            'flac',
+            *picture,
+            *(
+                f'--tag={key}={val}'
+                for key, val in info.items()
+                if key not in NON_TAG_KEYS
+            ),
+            f'--output-name={outfile}',
+            infile,
+        ]
+
+        jobs.append((cmd, outfile))
+
+    futures = [
+        _FLAC_POOL.submit(_run_flac, cmd, outfile)
+        for cmd, outfile in jobs
+    ]
+    for future in as_completed(futures):
+        outfile, returncode = future.result()
+        if returncode != 0:
+            log.error(
+                "Failed to create file (flac exit code %d): %s",
+                returncode,
+                outfile,
+            )
 
     if coverart is not None:
         fname = os.path.basename(coverart)
-        if totaldiscs > 1:
-            fname = f"{discnum:d}-{fname}"
+        if cover_totaldiscs > 1:
+            fname = f"{cover_discnum:d}-{fname}"
         dst = os.path.join(outdir, fname)
         log.info("%s - Moving coverart: %s --> %s", dev, coverart, dst)
         os.rename(
@@ -153,77 +201,133 @@ def convert2FLAC(
     return True
 
 
-def cdparanoia_progress(dev, proc, progress):
+def _run_flac(cmd: list[str], outfile: str) -> tuple:
     """
+    Run 'flac' command for a single track
+
     Arguments:
-        dev (str): Dev device to rip from
-        proc (Popen): Popen instances to read from stdout
-        progress (QDialog): A progress dialog object.
+        cmd (list[str]): Full 'flac' command to run
+        outfile (str): FLAC file being created
+
+    Returns:
+        tuple: The output file and the return code of the 'flac' process
 
     """
 
-    prog = 0
-    current = None
+    log = logging.getLogger(__name__)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Running 'flac' command: %s", cmd)
 
-    while proc.poll() is None:
-        line = proc.stdout.readline().strip()
+    # Spawn directly rather than fork/exec so that the (large) GUI process
+    # does not need to be copied for every track; output goes to devnull
+    pid = os.posix_spawnp(
+        cmd[0],
+        cmd,
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ],
+        # Python ignores these; reset to default as Popen does
+        setsigdef=(signal.SIGPIPE, signal.SIGXFSZ),
+    )
+    _, status = os.waitpid(pid, 0)
+    returncode = os.waitstatus_to_exitcode(status)
 
-        while line != b'' and proc.poll() is None:
-            search = re.search(CURRENT, line)
-            if search is not None:
-                current = str(int(search.group(1)))
-                progress.CD_CUR_TRACK.emit(dev, current)
-                break
+    return outfile, returncode
 
-            pos_size = parse_progress_line(line)
-            if pos_size is None:
-                break
 
-            pos, size = pos_size
-            if pos != prog:
-                prog = pos
-                progress.CD_TRACK_SIZE.emit(
-                    dev,
-                    round(pos / size * 100)
-                )
+@functools.lru_cache(maxsize=512)
+def safe_path(name: str) -> str:
+    """
+    Sanitize string for use as file/directory name
 
-            line = proc.stdout.readline().strip()
+    Replaces path separators and other characters that are invalid in file
+    names on common file systems with underscores. Results are cached as
+    the same artist/album names are sanitized for every track.
 
-    progress.CD_TRACK_SIZE.emit(dev, 100)
-    progress.CD_REMOVE_DISC.emit(dev)
+    Arguments:
+        name (str): String to sanitize
 
+    Returns:
+        str: Sanitized string
 
-def parse_progress_line(line):
+    """
 
-    _match = re.search(PROGRESS, line)
-    if _match is None:
-        return None
+    return name.translate(PATH_TRANS)
 
-    _match = _match.group(1)
-    prog = re.search(rb'\S', _match)
-    if prog is None:
-        return None
 
-    return prog.start(), len(_match)
+def cdparanoia_progress(dev, proc, progress):
+    """
+    Arguments:
+        dev (str): Dev device to rip from
+        proc (Popen): Popen instances to read from stdout
+        progress (QDialog): A progress dialog object.
 
+    Notes:
+        Output is read from the raw pipe file descriptor into a preallocated
+        buffer; cdparanoia redraws its progress bar with carriage returns,
+        so there can be many records per read. All complete records in a
+        read are scanned in order with a single pattern that matches either
+        a track change or a progress bar. The track size signal is only
+        emitted when the (integer) percent complete changes.
 
-def gen_tmpdir(dev):
     """
-    Generate temporary directory for raw output
 
+    fd = proc.stdout.fileno()
+    buf = bytearray(READ_SIZE)
+    view = memoryview(buf)
+    carry = b''
+    pct = -1
+    records = RECORD_RE.finditer
+    # Bind signal emitters once; looking up a bound signal builds new object
+    emit_track = progress.CD_CUR_TRACK.emit
+    emit_size = progress.CD_TRACK_SIZE.emit
+
+    # Blocking reads; pipe returns EOF (zero bytes) once cdparanoia exits,
+    # so there is no need to poll the process
+    while True:
+        nbytes = os.readv(fd, [buf])
+        if nbytes == 0:
+            break
+
+        data = carry + view[:nbytes]
+        end = max(data.rfind(b'\r'), data.rfind(b'\n'))
+        if end < 0:
+            carry = data
+            continue
+        carry = data[end+1:]
+
+        for record in records(data, 0, end):
+            track, bar = record.groups()
+            if track is not None:
+                pct = -1
+                emit_track(dev, str(int(track)))
+                continue
+
+            prog = NONSPACE_RE.search(bar)
+            if prog is None:
+                continue
+
+            new_pct = round(prog.start() / len(bar) * 100)
+            if new_pct != pct:
+                pct = new_pct
+                emit_size(dev, pct)
+
+    emit_size(dev, 100)
+    progress.CD_REMOVE_DISC.emit(dev)
+
+
+def gen_tmpdir(dev):
     """
+    Generate temporary directory for raw output
 
-    _hash = hashlib.md5(
-        f"{time.time()}{dev}".encode()
-    ).hexdigest()
+    The directory is created atomically with a unique name, so rips from
+    multiple drives never share a directory.
 
-    tmpdir = os.path.join(
-        tempfile.gettempdir(),
-        _hash,
-    )
-    os.makedirs(tmpdir, exist_ok=True)
+    """
 
-    return tmpdir
+    return tempfile.mkdtemp(prefix=f"cdripper-{os.path.basename(dev)}-")
 
 
 def listdir(directory, ext: str = '.wav') -> tuple[str]:
@@ -241,24 +345,55 @@ def listdir(directory, ext: str = '.wav') -> tuple[str]:
 
     """
 
-    for item in os.listdir(directory):
-        if not item.endswith(ext):
-            continue
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith(ext):
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
 
-        obj = re.search(TRACK_NUM, item)
-        if obj is None:
-            continue
+            # cdparanoia names files 'trackNN.cdda.wav'; parse number
+            # directly in that case and only use the regex otherwise
+            name = entry.name
+            num = name[5:name.find('.', 5)]
+            if not (name.startswith('track') and num.isdigit()):
+                obj = TRACK_NUM_RE.search(name)
+                if obj is None:
+                    continue
+                num = obj.group(1)
+
+            yield str(int(num)), entry.path
 
-        track_num = str(int(obj.group(1)))
-        yield track_num, os.path.join(directory, item)
+
+def eject(dev: str) -> None:
+    """
+    Eject disc from drive
+
+    Issue the CDROMEJECT ioctl directly on the device rather than forking the
+    'eject' CLI. If the ioctl fails (e.g., not on Linux), fall back to the
+    'eject' CLI.
+
+    Arguments:
+        dev (str): Dev device to eject
+
+    """
+
+    try:
+        fd = os.open(dev, os.O_RDONLY | os.O_NONBLOCK)
+        try:
+            fcntl.ioctl(fd, CDROMEJECT)
+        finally:
+            os.close(fd)
+    except OSError as err:
+        logging.getLogger(__name__).debug(
+            "%s - ioctl eject failed, falling back to CLI: %s",
+            dev,
+            err,
+        )
+        call(['eject', dev])
 
 
 def cleanup(directory: str):
     """Recursively delete directory"""
 
-    for root, dirs, items in os.walk(directory):
-        for item in items:
-            path = os.path.join(root, item)
-            if os.path.isfile(path):
-                os.remove(path)
-        os.rmdir(root)
+    shutil.rmtree(directory, ignore_errors=True)